@@ -1,18 +1,89 @@
 """Module for Jira account management operations."""
 
+import functools
+import hashlib
+import itertools
 import logging
 import os
+import re
 import time
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import Any, Dict, List
 
+from cachetools import TTLCache
+
 from ..models.jira.account import Account, TimeLogEntry
 from ..models.jira.common import JiraUser
 from ..models.jira.project import JiraProject
 from .client import JiraClient
+from .config import JiraConfig
+from .constants import PROJECTS_CACHE_TTL_SECONDS
 
 logger = logging.getLogger("mcp-jira")
 
+# Fallback time format: a number with an optional h/m/d unit (minutes by default)
+_TIME_SPENT_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([hmd]?)\s*$")
+_TIME_UNIT_SECONDS = {"h": 3600, "m": 60, "d": 24 * 3600, "": 60}
+
+# One "account:KEY1,KEY2" entry of ACCOUNT_MAPPINGS; entries are separated by ";"
+_ACCOUNT_MAPPING_RE = re.compile(r"([^:;]+):([^;]+)(?:;|$)")
+
+# Project lists shared by every fetcher for the same Jira site and credentials.
+# A fetcher is built per tool call, so the cache has to outlive the instance.
+# Entries are (fetched_at, projects, projects_by_key).
+_PROJECTS_CACHE: TTLCache[
+    str, tuple[float, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+] = TTLCache(maxsize=100, ttl=PROJECTS_CACHE_TTL_SECONDS)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_account_mappings(
+    account_mappings: str,
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """
+    Parse an ACCOUNT_MAPPINGS value.
+
+    Results are cached per value, so every JiraFetcher instance loading the
+    same mappings shares one parse and a changed value is parsed afresh.
+
+    Args:
+        account_mappings: Mappings in the format account1:PROJ1,PROJ2;account2:PROJ3
+
+    Returns:
+        Tuple of (account_name, project_keys) pairs in declaration order
+    """
+    return tuple(
+        (
+            match.group(1).strip(),
+            tuple(key for key in map(str.strip, match.group(2).split(",")) if key),
+        )
+        for match in _ACCOUNT_MAPPING_RE.finditer(account_mappings)
+    )
+
+
+def _projects_cache_key(config: JiraConfig) -> str:
+    """
+    Build the project cache key for a Jira site and the credentials used on it.
+
+    Args:
+        config: The Jira configuration of the fetcher
+
+    Returns:
+        A SHA-256 hex digest, so credentials are not kept as cache keys
+    """
+    oauth_config = config.oauth_config
+    parts = (
+        config.url,
+        config.auth_type,
+        config.username,
+        config.api_token,
+        config.personal_token,
+        oauth_config.cloud_id if oauth_config else None,
+        oauth_config.access_token if oauth_config else None,
+    )
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
 
 class AccountsMixin(JiraClient):
     """Mixin for account management operations."""
@@ -21,6 +92,9 @@ class AccountsMixin(JiraClient):
         super().__init__(*args, **kwargs)
         self._accounts: Dict[str, Account] = {}
         self._account_project_mappings: Dict[str, List[str]] = {}
+        self._project_to_accounts: Dict[str, set[str]] = {}
+        self._account_names_lower: Dict[str, str] = {}
+        self._projects_by_key: Dict[str, Dict[str, Any]] = {}
         # Defer loading account mappings until after other mixins are initialized
         self._accounts_loaded = False
     
@@ -38,44 +112,112 @@ class AccountsMixin(JiraClient):
         in the format: ACCOUNT_MAPPINGS=account1:PROJ1,PROJ2;account2:PROJ3,PROJ4
         """
         try:
-            account_mappings = os.getenv("ACCOUNT_MAPPINGS", "")
+            account_mappings = os.getenv("ACCOUNT_MAPPINGS")
             if not account_mappings:
                 logger.info("No ACCOUNT_MAPPINGS environment variable found. Using default mapping.")
                 # Create a default account mapping based on available projects
                 self._create_default_account_mapping()
                 return
                 
-            # Parse the account mappings
-            for account_mapping in account_mappings.split(";"):
-                if ":" not in account_mapping:
-                    continue
-                    
-                account_name, project_keys_str = account_mapping.split(":", 1)
-                project_keys = [key.strip() for key in project_keys_str.split(",")]
-                
-                # Create account
-                account = Account(
-                    id=account_name.strip(),
-                    name=account_name.strip(),
-                    project_keys=project_keys,
+            # Build accounts from the cached parse of the mappings
+            accounts = [
+                Account(
+                    id=account_name,
+                    name=account_name,
+                    project_keys=list(project_keys),
                     is_active=True,
                 )
+                for account_name, project_keys in _parse_account_mappings(
+                    account_mappings
+                )
+            ]
+            self._accounts = {account.id: account for account in accounts}
+            self._account_project_mappings = {
+                account.id: list(account.project_keys) for account in accounts
+            }
                 
-                self._accounts[account.id] = account
-                self._account_project_mappings[account.id] = project_keys
-                
-            logger.info(f"Loaded {len(self._accounts)} accounts from environment mappings")
+            logger.info(
+                "Loaded %s accounts from environment mappings", len(self._accounts)
+            )
             
         except Exception as e:
-            logger.error(f"Error loading account mappings: {e}")
+            logger.error("Error loading account mappings: %s", e)
             self._create_default_account_mapping()
+        finally:
+            self._index_account_projects()
+            self._index_account_names()
+    
+    def _index_account_projects(self) -> None:
+        """Build the reverse project key to account IDs index."""
+        project_to_accounts: Dict[str, set[str]] = {}
+        for account_id, project_keys in self._account_project_mappings.items():
+            for project_key in project_keys:
+                project_to_accounts.setdefault(project_key, set()).add(account_id)
+        self._project_to_accounts = project_to_accounts
+    
+    def _index_account_names(self) -> None:
+        """Build the account ID to lowercased name index used by search filters."""
+        self._account_names_lower = {
+            account_id: account.name.lower()
+            for account_id, account in self._accounts.items()
+        }
+    
+    def reload_account_mappings(self) -> None:
+        """Load accounts again from the current ACCOUNT_MAPPINGS value."""
+        self._accounts = {}
+        self._account_project_mappings = {}
+        self._load_account_mappings()
+        self._accounts_loaded = True
+    
+    def _get_all_projects_cached(
+        self,
+        get_all_projects: Callable[[], List[Dict[str, Any]]],
+        ttl: float = PROJECTS_CACHE_TTL_SECONDS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all projects, reusing a recent result from ProjectsMixin.
+        
+        The result is shared with other fetchers for the same Jira site and
+        credentials, so it carries over between tool calls.
+        
+        Args:
+            get_all_projects: The caller's resolved ProjectsMixin.get_all_projects
+            ttl: Maximum age in seconds of a cached project list
+            
+        Returns:
+            List of project data dictionaries
+        """
+        cache_key = _projects_cache_key(self.config)
+        now = time.monotonic()
+        cached = _PROJECTS_CACHE.get(cache_key)
+        if cached is not None and now - cached[0] < ttl:
+            _, projects, self._projects_by_key = cached
+            return projects
+            
+        projects = get_all_projects()
+        projects_by_key = {
+            project["key"]: project for project in projects if project.get("key")
+        }
+        # get_all_projects returns [] on errors, so don't pin a failed fetch
+        if projects:
+            _PROJECTS_CACHE[cache_key] = (now, projects, projects_by_key)
+        else:
+            _PROJECTS_CACHE.pop(cache_key, None)
+        self._projects_by_key = projects_by_key
+        return projects
+    
+    def invalidate_projects_cache(self) -> None:
+        """Force the next project lookup for this site and user to fetch again."""
+        _PROJECTS_CACHE.pop(_projects_cache_key(self.config), None)
+        self._projects_by_key = {}
     
     def _create_default_account_mapping(self) -> None:
         """Create a default account mapping based on available projects."""
         try:
             # Get all available projects using the method from ProjectsMixin
-            if hasattr(self, 'get_all_projects'):
-                all_projects = self.get_all_projects()
+            get_all_projects = getattr(self, "get_all_projects", None)
+            if get_all_projects is not None:
+                all_projects = self._get_all_projects_cached(get_all_projects)
             else:
                 logger.warning("get_all_projects method not available. Creating empty default account.")
                 all_projects = []
@@ -106,38 +248,97 @@ class AccountsMixin(JiraClient):
             self._accounts["default"] = default_account
             self._account_project_mappings["default"] = default_account.project_keys
             
-            logger.info(f"Created default account with {len(default_account.project_keys)} projects")
+            logger.info(
+                "Created default account with %s projects",
+                len(default_account.project_keys),
+            )
             
         except Exception as e:
-            logger.error(f"Error creating default account mapping: {e}")
+            logger.error("Error creating default account mapping: %s", e)
     
-    def get_all_accounts(self, search_filter: str | None = None) -> List[Dict[str, Any]]:
+    def _iter_matching_accounts(self, search_filter: str | None) -> Iterable[Account]:
+        """
+        Iterate over the loaded accounts whose names match a search filter.
+        
+        Args:
+            search_filter: Optional case-insensitive substring of the account name
+            
+        Returns:
+            Iterable of matching accounts in registry order
+        """
+        accounts = self._accounts.values()
+        if not search_filter:
+            return accounts
+            
+        # Lowercase the filter once; account names were lowercased at load time
+        needle = search_filter.lower()
+        names_lower = self._account_names_lower
+        return (
+            account for account in accounts if needle in names_lower.get(account.id, "")
+        )
+    
+    def get_all_accounts(
+        self,
+        search_filter: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
         """
         Get all available accounts.
         
         Args:
             search_filter: Optional search filter to match account names
+            limit: Maximum number of accounts to return (None for all)
+            offset: Number of matching accounts to skip
             
         Returns:
             List of account dictionaries
+            
+        Raises:
+            ValueError: If limit or offset is negative
         """
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must not be negative, got {limit}")
+            
         try:
             self._ensure_accounts_loaded()
-            accounts = []
-            
-            for account in self._accounts.values():
-                # Apply search filter if provided
-                if search_filter and search_filter.lower() not in account.name.lower():
-                    continue
-                    
-                accounts.append(account.to_simplified_dict())
+            accounts = self._iter_matching_accounts(search_filter)
                 
-            return accounts
+            # Only serialize the requested page of matching accounts
+            if limit is not None or offset:
+                stop = None if limit is None else offset + limit
+                accounts = itertools.islice(accounts, offset, stop)
+                
+            # Accounts created by the same user share one serialized user
+            user_cache: Dict[int, Dict[str, Any]] = {}
+            return [account.to_simplified_dict(user_cache) for account in accounts]
             
         except Exception as e:
-            logger.error(f"Error getting all accounts: {e}")
+            logger.error("Error getting all accounts: %s", e)
             return []
     
+    def count_accounts(self, search_filter: str | None = None) -> int:
+        """
+        Count the accounts matching a search filter.
+        
+        Gives the total number of matches behind a page of get_all_accounts.
+        
+        Args:
+            search_filter: Optional search filter to match account names
+            
+        Returns:
+            Number of matching accounts
+        """
+        try:
+            self._ensure_accounts_loaded()
+            return sum(1 for _ in self._iter_matching_accounts(search_filter))
+            
+        except Exception as e:
+            logger.error("Error counting accounts: %s", e)
+            return 0
+    
     def get_account(self, account_id: str) -> Account | None:
         """
         Get account by ID.
@@ -163,29 +364,28 @@ class AccountsMixin(JiraClient):
         """
         try:
             self._ensure_accounts_loaded()
-            account = self.get_account(account_id)
+            account = self._accounts.get(account_id)
             if not account:
-                logger.warning(f"Account {account_id} not found")
+                logger.warning("Account %s not found", account_id)
                 return []
                 
-            # Get all projects using the method from ProjectsMixin
-            if hasattr(self, 'get_all_projects'):
-                all_projects = self.get_all_projects()
-            else:
+            # Refresh the project index using the method from ProjectsMixin
+            get_all_projects = getattr(self, "get_all_projects", None)
+            if get_all_projects is None:
                 logger.warning("get_all_projects method not available")
                 return []
+            self._get_all_projects_cached(get_all_projects)
             
-            # Filter projects by account's project keys
-            account_projects = []
-            for project in all_projects:
-                project_key = project.get("key", "")
-                if project_key in account.project_keys:
-                    account_projects.append(project)
-                    
-            return account_projects
+            # Look up the account's project keys directly in the index
+            projects_by_key = self._projects_by_key
+            return [
+                projects_by_key[key]
+                for key in account.project_keys
+                if key in projects_by_key
+            ]
             
         except Exception as e:
-            logger.error(f"Error getting projects for account {account_id}: {e}")
+            logger.error("Error getting projects for account %s: %s", account_id, e)
             return []
     
     def validate_account_access(self, account_id: str, project_key: str | None = None) -> bool:
@@ -196,28 +396,57 @@ class AccountsMixin(JiraClient):
             account_id: The account ID
             project_key: Optional project key to validate access
             
+        Returns:
+            True if access is valid, False otherwise
+        """
+        self._ensure_accounts_loaded()
+        return self._validate_account_access_obj(
+            self._accounts.get(account_id), account_id, project_key
+        )
+    
+    def _validate_account_access_obj(
+        self, account: Account | None, account_id: str, project_key: str | None
+    ) -> bool:
+        """
+        Validate project access for an already looked-up account.
+        
+        The account object is only checked for existence and is_active.
+        Project membership comes from the reverse index _project_to_accounts,
+        which is the source of truth for account projects and is rebuilt from
+        the loaded mappings; the account's own project_keys are not consulted.
+        
+        Args:
+            account: The account object, or None if the lookup failed
+            account_id: The account ID, used for logging and the index lookup
+            project_key: Optional project key to validate access
+            
         Returns:
             True if access is valid, False otherwise
         """
         try:
-            self._ensure_accounts_loaded()
-            account = self.get_account(account_id)
             if not account:
-                logger.warning(f"Account {account_id} not found")
+                logger.warning("Account %s not found", account_id)
                 return False
                 
             if not account.is_active:
-                logger.warning(f"Account {account_id} is not active")
+                logger.warning("Account %s is not active", account_id)
                 return False
                 
-            if project_key and project_key not in account.project_keys:
-                logger.warning(f"Account {account_id} does not have access to project {project_key}")
+            # Constant-time membership check against the reverse index
+            if project_key and account_id not in self._project_to_accounts.get(
+                project_key, ()
+            ):
+                logger.warning(
+                    "Account %s does not have access to project %s",
+                    account_id,
+                    project_key,
+                )
                 return False
                 
             return True
             
         except Exception as e:
-            logger.error(f"Error validating account access: {e}")
+            logger.error("Error validating account access: %s", e)
             return False
     
     def log_time_to_account(
@@ -245,14 +474,18 @@ class AccountsMixin(JiraClient):
         """
         try:
             self._ensure_accounts_loaded()
+            account = self._accounts.get(account_id)
             # Validate account access
-            if not self.validate_account_access(account_id, project_key):
+            if not self._validate_account_access_obj(account, account_id, project_key):
                 raise ValueError(f"Invalid account access for account {account_id}")
+            account_name = account.name if account else account_id
                 
             # If issue_key is provided, use existing worklog functionality
             if issue_key:
-                if hasattr(self, 'add_worklog'):
-                    worklog_result = self.add_worklog(
+                # Resolve the WorklogMixin method once instead of hasattr + call
+                add_worklog = getattr(self, "add_worklog", None)
+                if add_worklog is not None:
+                    worklog_result = add_worklog(
                         issue_key=issue_key,
                         time_spent=time_spent,
                         comment=description,
@@ -276,7 +509,7 @@ class AccountsMixin(JiraClient):
                     return {
                         "success": True,
                         "message": f"Time logged successfully to account {account_id}",
-                        "account_name": self.get_account(account_id).name if self.get_account(account_id) else account_id,
+                        "account_name": account_name,
                         "time_log_entry": time_log_entry.to_simplified_dict(),
                     }
                 else:
@@ -287,14 +520,14 @@ class AccountsMixin(JiraClient):
                 # This is a conceptual implementation - in practice, you might
                 # want to create a special issue type or use a different approach
                 
-                # Parse time spent to seconds
-                if hasattr(self, '_parse_time_spent'):
-                    time_spent_seconds = self._parse_time_spent(time_spent)
-                else:
-                    # Simple fallback parsing
-                    time_spent_seconds = self._simple_parse_time_spent(time_spent)
+                # Parse time spent to seconds, falling back to simple parsing
+                parse_time_spent = getattr(
+                    self, "_parse_time_spent", self._simple_parse_time_spent
+                )
+                time_spent_seconds = parse_time_spent(time_spent)
                 
-                # Create time log entry
+                # Create time log entry, stamping all timestamps with one clock read
+                now_iso = datetime.now().isoformat()
                 time_log_entry = TimeLogEntry(
                     id=f"account_{account_id}_{int(time.time())}",
                     account_id=account_id,
@@ -302,20 +535,20 @@ class AccountsMixin(JiraClient):
                     time_spent=time_spent,
                     time_spent_seconds=time_spent_seconds,
                     description=description,
-                    started=started or datetime.now().isoformat(),
-                    created=datetime.now().isoformat(),
-                    updated=datetime.now().isoformat(),
+                    started=started or now_iso,
+                    created=now_iso,
+                    updated=now_iso,
                 )
                 
                 return {
                     "success": True,
                     "message": f"Time logged successfully to account {account_id}",
-                    "account_name": self.get_account(account_id).name if self.get_account(account_id) else account_id,
+                    "account_name": account_name,
                     "time_log_entry": time_log_entry.to_simplified_dict(),
                 }
                 
         except Exception as e:
-            logger.error(f"Error logging time to account {account_id}: {e}")
+            logger.error("Error logging time to account %s: %s", account_id, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -331,15 +564,10 @@ class AccountsMixin(JiraClient):
         Returns:
             Time spent in seconds
         """
-        try:
-            if time_spent.endswith("h"):
-                return int(float(time_spent[:-1]) * 3600)
-            elif time_spent.endswith("m"):
-                return int(float(time_spent[:-1]) * 60)
-            elif time_spent.endswith("d"):
-                return int(float(time_spent[:-1]) * 24 * 3600)
-            else:
-                return int(float(time_spent) * 60)  # Default to minutes
-        except (ValueError, TypeError):
-            logger.warning(f"Could not parse time: {time_spent}, defaulting to 60 seconds")
-            return 60 
\ No newline at end of file
+        match = _TIME_SPENT_RE.match(time_spent) if isinstance(time_spent, str) else None
+        if match:
+            value, unit = match.groups()
+            return int(float(value) * _TIME_UNIT_SECONDS[unit])
+            
+        logger.warning("Could not parse time: %s, defaulting to 60 seconds", time_spent)
+        return 60 
\ No newline at end of file
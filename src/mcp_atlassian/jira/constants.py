@@ -13,3 +13,6 @@ DEFAULT_READ_JIRA_FIELDS: set[str] = {
     "updated",
     "issuetype",
 }
+
+# How long AccountsMixin reuses the project list before fetching it again.
+PROJECTS_CACHE_TTL_SECONDS: float = 60.0
@@ -17,6 +17,34 @@ from .common import JiraUser
 logger = logging.getLogger(__name__)
 
 
+def _simplified_user(
+    user: JiraUser, user_cache: dict[int, dict[str, Any]] | None
+) -> dict[str, Any]:
+    """
+    Serialize a user, reusing an earlier result for the same object.
+    
+    Args:
+        user: The user to serialize
+        user_cache: Optional cache keyed by object identity, shared across the
+            models serialized for one response
+            
+    Returns:
+        The simplified user dictionary
+    """
+    if user_cache is None:
+        return user.to_simplified_dict()
+        
+    simplified = user_cache.get(id(user))
+    if simplified is None:
+        simplified = user_cache[id(user)] = user.to_simplified_dict()
+    return simplified
+
+
+def _optional_str(value: Any) -> str | None:
+    """Coerce a non-None value to str, keeping None as None."""
+    return None if value is None else str(value)
+
+
 class Account(ApiModel):
     """
     Model representing an account that groups projects.
@@ -35,7 +63,11 @@ class Account(ApiModel):
     @classmethod
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "Account":
         """
-        Create an Account from API response data.
+        Create an Account from trusted API response data.
+        
+        Fields are coerced by hand and the instance is built with
+        model_construct, skipping Pydantic validation. Use
+        from_api_response_validated for untrusted input.
         
         Args:
             data: The account data from the API
@@ -43,13 +75,47 @@ class Account(ApiModel):
         Returns:
             An Account instance
         """
-        if not data:
+        fields = cls._fields_from_api_response(data)
+        if fields is None:
             return cls()
+        return cls.model_construct(**fields)
+    
+    @classmethod
+    def from_api_response_validated(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> "Account":
+        """
+        Create an Account from API response data with full validation.
+        
+        Args:
+            data: The account data from the API
+            
+        Returns:
+            An Account instance
+        """
+        fields = cls._fields_from_api_response(data)
+        if fields is None:
+            return cls()
+        return cls(**fields)
+    
+    @classmethod
+    def _fields_from_api_response(cls, data: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Extract Account field values from API response data.
+        
+        Args:
+            data: The account data from the API
+            
+        Returns:
+            Field values keyed by field name, or None for empty or invalid data
+        """
+        if not data:
+            return None
             
         # Handle non-dictionary data by returning a default instance
         if not isinstance(data, dict):
             logger.debug("Received non-dictionary data, returning default instance")
-            return cls()
+            return None
             
         # Extract created_by data if available
         created_by = None
@@ -57,32 +123,57 @@ class Account(ApiModel):
         if created_by_data:
             created_by = JiraUser.from_api_response(created_by_data)
             
-        return cls(
-            id=str(data.get("id", JIRA_DEFAULT_ID)),
-            name=str(data.get("name", EMPTY_STRING)),
-            description=data.get("description"),
-            project_keys=data.get("project_keys", []),
-            is_active=bool(data.get("is_active", True)),
-            created_by=created_by,
-        )
+        # Only accept a real sequence; list() would split a string into characters
+        project_keys = data.get("project_keys")
+        if not isinstance(project_keys, list | tuple):
+            if project_keys is not None:
+                logger.debug(
+                    "Ignoring non-list project_keys of type %s",
+                    type(project_keys).__name__,
+                )
+            project_keys = []
+            
+        # Skip non-string keys so both construction paths agree
+        project_keys = [key for key in project_keys if isinstance(key, str)]
+            
+        return {
+            "id": str(data.get("id", JIRA_DEFAULT_ID)),
+            "name": str(data.get("name", EMPTY_STRING)),
+            "description": _optional_str(data.get("description")),
+            "project_keys": project_keys,
+            "is_active": bool(data.get("is_active", True)),
+            "created_by": created_by,
+        }
     
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API response."""
+    def to_simplified_dict(
+        self, user_cache: dict[int, dict[str, Any]] | None = None
+    ) -> dict[str, Any]:
+        """
+        Convert to simplified dictionary for API response.
+        
+        Args:
+            user_cache: Optional cache of serialized users, shared by callers
+                serializing many accounts that reference the same user objects
+                
+        Returns:
+            A dictionary with only the essential fields for API responses
+        """
+        project_keys = self.project_keys
         result = {
             "id": self.id,
             "name": self.name,
             "is_active": self.is_active,
-            "project_count": len(self.project_keys),
+            "project_count": len(project_keys),
         }
         
-        if self.description:
-            result["description"] = self.description
+        if description := self.description:
+            result["description"] = description
             
-        if self.project_keys:
-            result["project_keys"] = self.project_keys
+        if project_keys:
+            result["project_keys"] = project_keys
             
-        if self.created_by:
-            result["created_by"] = self.created_by.to_simplified_dict()
+        if created_by := self.created_by:
+            result["created_by"] = _simplified_user(created_by, user_cache)
             
         return result
 
@@ -110,7 +201,11 @@ class TimeLogEntry(ApiModel, TimestampMixin):
     @classmethod
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "TimeLogEntry":
         """
-        Create a TimeLogEntry from API response data.
+        Create a TimeLogEntry from trusted API response data.
+        
+        Fields are coerced by hand and the instance is built with
+        model_construct, skipping Pydantic validation. Use
+        from_api_response_validated for untrusted input.
         
         Args:
             data: The time log entry data from the API
@@ -118,13 +213,47 @@ class TimeLogEntry(ApiModel, TimestampMixin):
         Returns:
             A TimeLogEntry instance
         """
-        if not data:
+        fields = cls._fields_from_api_response(data)
+        if fields is None:
             return cls()
+        return cls.model_construct(**fields)
+    
+    @classmethod
+    def from_api_response_validated(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> "TimeLogEntry":
+        """
+        Create a TimeLogEntry from API response data with full validation.
+        
+        Args:
+            data: The time log entry data from the API
+            
+        Returns:
+            A TimeLogEntry instance
+        """
+        fields = cls._fields_from_api_response(data)
+        if fields is None:
+            return cls()
+        return cls(**fields)
+    
+    @classmethod
+    def _fields_from_api_response(cls, data: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Extract TimeLogEntry field values from API response data.
+        
+        Args:
+            data: The time log entry data from the API
+            
+        Returns:
+            Field values keyed by field name, or None for empty or invalid data
+        """
+        if not data:
+            return None
             
         # Handle non-dictionary data by returning a default instance
         if not isinstance(data, dict):
             logger.debug("Received non-dictionary data, returning default instance")
-            return cls()
+            return None
             
         # Extract user data if available
         user = None
@@ -141,48 +270,49 @@ class TimeLogEntry(ApiModel, TimestampMixin):
         except (ValueError, TypeError):
             time_spent_seconds = 0
             
-        return cls(
-            id=str(data.get("id", JIRA_DEFAULT_ID)),
-            account_id=str(data.get("account_id", JIRA_DEFAULT_ID)),
-            project_id=data.get("project_id"),
-            issue_key=data.get("issue_key"),
-            user=user,
-            time_spent=str(data.get("time_spent", EMPTY_STRING)),
-            time_spent_seconds=time_spent_seconds,
-            description=data.get("description"),
-            started=str(data.get("started", EMPTY_STRING)),
-            created=str(data.get("created", EMPTY_STRING)),
-            updated=str(data.get("updated", EMPTY_STRING)),
-        )
+        return {
+            "id": str(data.get("id", JIRA_DEFAULT_ID)),
+            "account_id": str(data.get("account_id", JIRA_DEFAULT_ID)),
+            "project_id": _optional_str(data.get("project_id")),
+            "issue_key": _optional_str(data.get("issue_key")),
+            "user": user,
+            "time_spent": str(data.get("time_spent", EMPTY_STRING)),
+            "time_spent_seconds": time_spent_seconds,
+            "description": _optional_str(data.get("description")),
+            "started": str(data.get("started", EMPTY_STRING)),
+            "created": str(data.get("created", EMPTY_STRING)),
+            "updated": str(data.get("updated", EMPTY_STRING)),
+        }
     
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API response."""
-        result = {
+    def to_simplified_dict(
+        self, user_cache: dict[int, dict[str, Any]] | None = None
+    ) -> dict[str, Any]:
+        """
+        Convert to simplified dictionary for API response.
+        
+        Args:
+            user_cache: Optional cache of serialized users, shared by callers
+                serializing many entries that reference the same user objects
+                
+        Returns:
+            A dictionary with only the essential fields for API responses
+        """
+        user = self.user
+        optional_fields = (
+            ("project_id", self.project_id),
+            ("issue_key", self.issue_key),
+            ("user", _simplified_user(user, user_cache) if user else None),
+            ("description", self.description),
+            ("started", self.started),
+            ("created", self.created),
+            ("updated", self.updated),
+        )
+        
+        # Required fields are always present; optional ones only when non-empty
+        return {
             "id": self.id,
             "account_id": self.account_id,
             "time_spent": self.time_spent,
             "time_spent_seconds": self.time_spent_seconds,
-        }
-        
-        if self.project_id:
-            result["project_id"] = self.project_id
-            
-        if self.issue_key:
-            result["issue_key"] = self.issue_key
-            
-        if self.user:
-            result["user"] = self.user.to_simplified_dict()
-            
-        if self.description:
-            result["description"] = self.description
-            
-        if self.started:
-            result["started"] = self.started
-            
-        if self.created:
-            result["created"] = self.created
-            
-        if self.updated:
-            result["updated"] = self.updated
-            
-        return result 
\ No newline at end of file
+            **{key: value for key, value in optional_fields if value},
+        } 
\ No newline at end of file
@@ -1668,6 +1668,18 @@ async def list_accounts(
             default=None,
         ),
     ] = None,
+    limit: Annotated[
+        int | None,
+        Field(
+            description="(Optional) Maximum number of accounts to return",
+            default=None,
+            ge=1,
+        ),
+    ] = None,
+    start_at: Annotated[
+        int,
+        Field(description="Starting index for pagination (0-based)", default=0, ge=0),
+    ] = 0,
 ) -> str:
     """
     Retrieve all available accounts for time logging and project management.
@@ -1678,22 +1690,33 @@ async def list_accounts(
     Args:
         ctx: The FastMCP context.
         search_filter: Optional search filter to match account names.
+        limit: Optional maximum number of accounts to return.
+        start_at: Starting index for pagination.
         
     Returns:
         JSON string representing a list of account objects with their details.
         Each account includes: id, name, description, project_count, and is_active status.
+        "total" counts every matching account, not just the returned page.
         
     Raises:
         ValueError: If the Jira client is not configured or available.
     """
     try:
         jira = await get_jira_fetcher(ctx)
-        accounts = jira.get_all_accounts(search_filter=search_filter)
+        accounts = jira.get_all_accounts(
+            search_filter=search_filter, limit=limit, offset=start_at
+        )
+        # A partial page needs a separate count of every matching account
+        if limit is None and not start_at:
+            total = len(accounts)
+        else:
+            total = jira.count_accounts(search_filter=search_filter)
         
         result = {
             "success": True,
             "accounts": accounts,
-            "total": len(accounts),
+            "total": total,
+            "start_at": start_at,
         }
         
         return json.dumps(result, indent=2, ensure_ascii=False)
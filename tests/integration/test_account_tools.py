@@ -2,500 +2,371 @@
 Integration tests for account-based MCP tools.
 
 This module tests the MCP tools for account-based time logging and project management
-including list_accounts, get_account_projects, and log_time_with_account.
+including list_accounts, get_account_projects, and log_time.
 """
 
-import json
-import os
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
-from mcp_atlassian.servers.context import Context
-from mcp_atlassian.servers.jira import list_accounts, get_account_projects, log_time_with_account
+from requests.exceptions import HTTPError
+
+from mcp_atlassian.servers.jira import list_accounts, get_account_projects, log_time
 from mcp_atlassian.models.jira.account import Account
 from mcp_atlassian.models.jira.project import JiraProject
-from mcp_atlassian.models.jira.worklog import JiraWorklog
+
+# Parse tool responses with orjson when it is installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Backend call made by log_time for the default test arguments
+_BASE_LOG_KWARGS = {
+    "account_id": "team-alpha",
+    "time_spent": "2h",
+    "description": None,
+    "project_key": None,
+    "issue_key": "PROJ-123",
+    "started": None,
+}
+
+_UNICODE_DESCRIPTION = "Development work with émojis 🚀 and special chars: áéíóú"
+
+# Configure pytest for async tests, sharing one event loop across the session,
+# and mark the module as integration tests (run with --integration)
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.integration]
+
+
+def _ok(result):
+    """Parse a tool response and assert that it reports success."""
+    data = _loads(result)
+    assert data["success"] is True
+    return data
+
+
+def _err(result, needle):
+    """Parse a tool response and assert that it reports an error containing needle."""
+    data = _loads(result)
+    assert data["success"] is False
+    assert needle in data["error"]
+    return data
+
+
+async def _invoke_log(ctx, **overrides):
+    """Call log_time with default test arguments."""
+    return await log_time(
+        ctx,
+        **{"account_id": "team-alpha", "issue_key": "PROJ-123", "time_spent": "2h", **overrides}
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_context():
+    """Create a stub FastMCP context; check_write_access reads its lifespan context."""
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context={}))
 
 
 class TestAccountMCPTools:
     """Test suite for account-based MCP tools."""
     
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context for testing."""
-        ctx = Mock(spec=Context)
-        ctx.dependencies = Mock()
-        ctx.dependencies.jira = Mock()
-        ctx.dependencies.jira.get_accounts = Mock()
-        ctx.dependencies.jira.get_account_projects = Mock()
-        ctx.dependencies.jira.log_time_to_account = Mock()
-        ctx.dependencies.jira.validate_account_access = Mock()
-        return ctx
+    @pytest.fixture(scope="class")
+    def mock_jira(self):
+        """Create a stub JiraFetcher shared by the tests in this class."""
+        return SimpleNamespace(
+            get_all_accounts=Mock(),
+            count_accounts=Mock(),
+            get_account_projects=Mock(),
+            get_account=Mock(),
+            log_time_to_account=Mock(),
+        )
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def patch_jira_fetcher(self, mock_jira):
+        """Clear the stub fetcher and hand it to the tools in place of a real one."""
+        for method in vars(mock_jira).values():
+            method.reset_mock(return_value=True, side_effect=True)
+        with patch(
+            "mcp_atlassian.servers.jira.get_jira_fetcher",
+            AsyncMock(return_value=mock_jira),
+        ):
+            yield
+
+    @pytest.fixture(scope="module")
     def sample_accounts(self):
-        """Sample accounts for testing."""
+        """Sample accounts for testing, as returned by get_all_accounts."""
         return [
-            Account(id="team-alpha", name="Team Alpha", description="Alpha team projects"),
-            Account(id="team-beta", name="Team Beta", description="Beta team projects"),
-            Account(id="client-work", name="Client Work", description="Client project work")
+            account.to_simplified_dict()
+            for account in (
+                Account.model_construct(id="team-alpha", name="Team Alpha", description="Alpha team projects"),
+                Account.model_construct(id="team-beta", name="Team Beta", description="Beta team projects"),
+                Account.model_construct(id="client-work", name="Client Work", description="Client project work"),
+            )
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_projects(self):
-        """Sample projects for testing."""
+        """Sample projects for testing, as returned by get_account_projects."""
         return [
-            JiraProject(id="10001", key="PROJ", name="Project 1"),
-            JiraProject(id="10002", key="DEV", name="Development Project")
+            JiraProject.model_construct(id="10001", key="PROJ", name="Project 1").to_simplified_dict(),
+            JiraProject.model_construct(id="10002", key="DEV", name="Development Project").to_simplified_dict(),
         ]
 
-    @pytest.fixture
-    def sample_worklog(self):
-        """Sample worklog for testing."""
-        return JiraWorklog(
-            id="12345",
-            author_account_id="user123",
-            author_display_name="Test User",
-            created="2024-01-01T10:00:00.000Z",
-            updated="2024-01-01T10:00:00.000Z",
-            started="2024-01-01T09:00:00.000Z",
-            time_spent="2h",
-            time_spent_seconds=7200,
-            comment="Test work"
-        )
+    @pytest.fixture(scope="module")
+    def sample_log_result(self):
+        """Sample log_time_to_account result for testing."""
+        return {
+            "success": True,
+            "message": "Time logged successfully to account team-alpha",
+            "account_name": "Team Alpha",
+            "time_log_entry": {
+                "id": "12345",
+                "account_id": "team-alpha",
+                "time_spent": "2h",
+                "time_spent_seconds": 7200,
+                "issue_key": "PROJ-123",
+                "started": "2024-01-01T09:00:00.000Z",
+            },
+        }
 
-    @pytest.mark.asyncio
-    async def test_list_accounts_all(self, mock_context, sample_accounts):
+    async def test_list_accounts_all(self, mock_context, mock_jira, sample_accounts):
         """Test listing all accounts."""
-        mock_context.dependencies.jira.get_accounts.return_value = sample_accounts
+        mock_jira.get_all_accounts.return_value = sample_accounts
         
         result = await list_accounts(mock_context)
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert len(data["accounts"]) == 3
+        data = _ok(result)
+        assert data["total"] == 3
         assert data["accounts"][0]["id"] == "team-alpha"
         assert data["accounts"][0]["name"] == "Team Alpha"
         assert data["accounts"][1]["id"] == "team-beta"
         assert data["accounts"][2]["id"] == "client-work"
         
         # Verify the method was called correctly
-        mock_context.dependencies.jira.get_accounts.assert_called_once_with(search_filter=None)
+        mock_jira.get_all_accounts.assert_called_once_with(
+            search_filter=None, limit=None, offset=0
+        )
+        mock_jira.count_accounts.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_list_accounts_with_filter(self, mock_context, sample_accounts):
+    async def test_list_accounts_with_filter(self, mock_context, mock_jira, sample_accounts):
         """Test listing accounts with search filter."""
         # Filter to only team accounts
-        filtered_accounts = [acc for acc in sample_accounts if "team" in acc.id]
-        mock_context.dependencies.jira.get_accounts.return_value = filtered_accounts
+        mock_jira.get_all_accounts.return_value = [
+            acc for acc in sample_accounts if "team" in acc["id"]
+        ]
         
         result = await list_accounts(mock_context, search_filter="team")
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert len(data["accounts"]) == 2
+        data = _ok(result)
+        assert data["total"] == 2
         assert data["accounts"][0]["id"] == "team-alpha"
         assert data["accounts"][1]["id"] == "team-beta"
         
         # Verify the method was called correctly
-        mock_context.dependencies.jira.get_accounts.assert_called_once_with(search_filter="team")
+        mock_jira.get_all_accounts.assert_called_once_with(
+            search_filter="team", limit=None, offset=0
+        )
 
-    @pytest.mark.asyncio
-    async def test_list_accounts_empty_result(self, mock_context):
-        """Test listing accounts with no results."""
-        mock_context.dependencies.jira.get_accounts.return_value = []
+    async def test_list_accounts_paginated(self, mock_context, mock_jira, sample_accounts):
+        """Test that a page of accounts reports the total number of matches."""
+        mock_jira.get_all_accounts.return_value = sample_accounts[1:2]
+        mock_jira.count_accounts.return_value = 3
         
-        result = await list_accounts(mock_context)
+        result = await list_accounts(mock_context, limit=1, start_at=1)
         
-        # Parse the JSON result
-        data = json.loads(result)
+        data = _ok(result)
+        assert [acc["id"] for acc in data["accounts"]] == ["team-beta"]
+        assert data["total"] == 3
+        assert data["start_at"] == 1
         
-        assert data["success"] is True
-        assert len(data["accounts"]) == 0
-        assert data["message"] == "No accounts found"
-
-    @pytest.mark.asyncio
-    async def test_list_accounts_error(self, mock_context):
-        """Test listing accounts with error."""
-        mock_context.dependencies.jira.get_accounts.side_effect = Exception("API Error")
+        # Verify the methods were called correctly
+        mock_jira.get_all_accounts.assert_called_once_with(
+            search_filter=None, limit=1, offset=1
+        )
+        mock_jira.count_accounts.assert_called_once_with(search_filter=None)
+
+    async def test_list_accounts_empty_result(self, mock_context, mock_jira):
+        """Test listing accounts with no results."""
+        mock_jira.get_all_accounts.return_value = []
         
         result = await list_accounts(mock_context)
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is False
-        assert "API Error" in data["error"]
+        data = _ok(result)
+        assert data["accounts"] == []
+        assert data["total"] == 0
 
-    @pytest.mark.asyncio
-    async def test_get_account_projects_success(self, mock_context, sample_projects):
+    async def test_get_account_projects_success(self, mock_context, mock_jira, sample_projects):
         """Test getting projects for an account."""
-        mock_context.dependencies.jira.get_account_projects.return_value = sample_projects
+        mock_jira.get_account_projects.return_value = sample_projects
+        mock_jira.get_account.return_value = Account.model_construct(
+            id="team-alpha", name="Team Alpha"
+        )
         
         result = await get_account_projects(mock_context, account_id="team-alpha")
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
+        data = _ok(result)
         assert data["account_id"] == "team-alpha"
-        assert len(data["projects"]) == 2
+        assert data["account_name"] == "Team Alpha"
+        assert data["total"] == 2
         assert data["projects"][0]["key"] == "PROJ"
         assert data["projects"][0]["name"] == "Project 1"
         assert data["projects"][1]["key"] == "DEV"
         assert data["projects"][1]["name"] == "Development Project"
         
         # Verify the method was called correctly
-        mock_context.dependencies.jira.get_account_projects.assert_called_once_with("team-alpha")
+        mock_jira.get_account_projects.assert_called_once_with("team-alpha")
 
-    @pytest.mark.asyncio
-    async def test_get_account_projects_empty_result(self, mock_context):
-        """Test getting projects for an account with no projects."""
-        mock_context.dependencies.jira.get_account_projects.return_value = []
+    async def test_get_account_projects_empty_result(self, mock_context, mock_jira):
+        """Test getting projects for an unknown account falls back to its ID."""
+        mock_jira.get_account_projects.return_value = []
+        mock_jira.get_account.return_value = None
         
         result = await get_account_projects(mock_context, account_id="team-alpha")
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
+        data = _ok(result)
         assert data["account_id"] == "team-alpha"
-        assert len(data["projects"]) == 0
-        assert data["message"] == "No projects found for account 'team-alpha'"
+        assert data["account_name"] == "team-alpha"
+        assert data["projects"] == []
+        assert data["total"] == 0
 
-    @pytest.mark.asyncio
-    async def test_get_account_projects_invalid_account(self, mock_context):
+    async def test_get_account_projects_invalid_account(self, mock_context, mock_jira):
         """Test getting projects for an invalid account."""
-        mock_context.dependencies.jira.get_account_projects.side_effect = ValueError("Account 'invalid-account' not found")
+        mock_jira.get_account_projects.side_effect = ValueError("Account 'invalid-account' not found")
         
         result = await get_account_projects(mock_context, account_id="invalid-account")
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is False
-        assert "Account 'invalid-account' not found" in data["error"]
-
-    @pytest.mark.asyncio
-    async def test_get_account_projects_error(self, mock_context):
-        """Test getting projects with API error."""
-        mock_context.dependencies.jira.get_account_projects.side_effect = Exception("API Error")
-        
-        result = await get_account_projects(mock_context, account_id="team-alpha")
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is False
-        assert "API Error" in data["error"]
-
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_success(self, mock_context, sample_worklog):
-        """Test logging time with account ID."""
-        mock_context.dependencies.jira.log_time_to_account.return_value = sample_worklog
-        
-        result = await log_time_with_account(
-            mock_context,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work"
-        )
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert data["account_id"] == "team-alpha"
-        assert data["issue_key"] == "PROJ-123"
-        assert data["time_spent"] == "2h"
-        assert data["time_spent_seconds"] == 7200
-        assert data["description"] == "Development work"
-        assert data["worklog_id"] == "12345"
-        
-        # Verify the method was called correctly
-        mock_context.dependencies.jira.log_time_to_account.assert_called_once_with(
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work",
-            project_key=None,
-            started=None
-        )
-
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_and_project(self, mock_context, sample_worklog):
-        """Test logging time with account ID and project key."""
-        mock_context.dependencies.jira.log_time_to_account.return_value = sample_worklog
-        
-        result = await log_time_with_account(
-            mock_context,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work",
-            project_key="PROJ"
-        )
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert data["account_id"] == "team-alpha"
-        assert data["project_key"] == "PROJ"
-        assert data["issue_key"] == "PROJ-123"
-        
-        # Verify the method was called correctly
-        mock_context.dependencies.jira.log_time_to_account.assert_called_once_with(
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work",
-            project_key="PROJ",
-            started=None
-        )
+        _err(result, "Account 'invalid-account' not found")
 
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_with_started_time(self, mock_context, sample_worklog):
-        """Test logging time with account ID and started time."""
-        mock_context.dependencies.jira.log_time_to_account.return_value = sample_worklog
-        
-        result = await log_time_with_account(
-            mock_context,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work",
-            started="2024-01-01T09:00:00.000Z"
-        )
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert data["started"] == "2024-01-01T09:00:00.000Z"
+    @pytest.mark.parametrize(
+        "tool_kwargs, expected_extra",
+        [
+            pytest.param(
+                {"description": "Development work"},
+                {"description": "Development work"},
+                id="success",
+            ),
+            pytest.param(
+                {"description": "Development work", "project_id": "PROJ"},
+                {"description": "Development work", "project_key": "PROJ"},
+                id="with_project",
+            ),
+            pytest.param(
+                {"description": "Development work", "started": "2024-01-01T09:00:00.000Z"},
+                {"description": "Development work", "started": "2024-01-01T09:00:00.000Z"},
+                id="with_started_time",
+            ),
+            pytest.param({}, {}, id="minimal_params"),
+            pytest.param(
+                {"description": _UNICODE_DESCRIPTION},
+                {"description": _UNICODE_DESCRIPTION},
+                id="unicode_description",
+            ),
+        ],
+    )
+    async def test_log_time_with_account(
+        self, mock_context, mock_jira, sample_log_result, tool_kwargs, expected_extra
+    ):
+        """Test logging time with account ID and optional parameters."""
+        mock_jira.log_time_to_account.return_value = sample_log_result
+        
+        data = _ok(await _invoke_log(mock_context, **tool_kwargs))
+        assert data == sample_log_result
         
         # Verify the method was called correctly
-        mock_context.dependencies.jira.log_time_to_account.assert_called_once_with(
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work",
-            project_key=None,
-            started="2024-01-01T09:00:00.000Z"
+        mock_jira.log_time_to_account.assert_called_once_with(
+            **{**_BASE_LOG_KWARGS, **expected_extra}
         )
 
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_invalid_account(self, mock_context):
+    async def test_log_time_with_account_invalid_account(self, mock_context, mock_jira):
         """Test logging time with invalid account ID."""
-        mock_context.dependencies.jira.log_time_to_account.side_effect = ValueError("Account 'invalid-account' not found")
+        mock_jira.log_time_to_account.return_value = {
+            "success": False,
+            "error": "Invalid account access for account invalid-account",
+        }
         
-        result = await log_time_with_account(
-            mock_context,
-            account_id="invalid-account",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work"
+        result = await _invoke_log(
+            mock_context, account_id="invalid-account", description="Development work"
         )
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is False
-        assert "Account 'invalid-account' not found" in data["error"]
+        _err(result, "Invalid account access for account invalid-account")
 
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_invalid_project(self, mock_context):
+    async def test_log_time_with_account_invalid_project(self, mock_context, mock_jira):
         """Test logging time with invalid project key."""
-        mock_context.dependencies.jira.log_time_to_account.side_effect = ValueError("Project 'INVALID' is not associated with account 'team-alpha'")
+        mock_jira.log_time_to_account.return_value = {
+            "success": False,
+            "error": "Invalid account access for account team-alpha",
+        }
         
-        result = await log_time_with_account(
+        result = await _invoke_log(
             mock_context,
-            account_id="team-alpha",
             issue_key="INVALID-123",
-            time_spent="2h",
             description="Development work",
-            project_key="INVALID"
-        )
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is False
-        assert "Project 'INVALID' is not associated with account 'team-alpha'" in data["error"]
-
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_api_error(self, mock_context):
-        """Test logging time with API error."""
-        mock_context.dependencies.jira.log_time_to_account.side_effect = Exception("API Error")
-        
-        result = await log_time_with_account(
-            mock_context,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Development work"
+            project_id="INVALID",
         )
         
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is False
-        assert "API Error" in data["error"]
+        _err(result, "Invalid account access for account team-alpha")
 
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_minimal_params(self, mock_context, sample_worklog):
-        """Test logging time with minimal required parameters."""
-        mock_context.dependencies.jira.log_time_to_account.return_value = sample_worklog
-        
-        result = await log_time_with_account(
-            mock_context,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h"
-        )
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert data["account_id"] == "team-alpha"
-        assert data["issue_key"] == "PROJ-123"
-        assert data["time_spent"] == "2h"
-        
-        # Verify the method was called correctly
-        mock_context.dependencies.jira.log_time_to_account.assert_called_once_with(
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="",
-            project_key=None,
-            started=None
-        )
-
-    @pytest.mark.asyncio
-    async def test_log_time_with_account_unicode_description(self, mock_context, sample_worklog):
-        """Test logging time with unicode characters in description."""
-        mock_context.dependencies.jira.log_time_to_account.return_value = sample_worklog
-        
-        unicode_description = "Development work with émojis 🚀 and special chars: áéíóú"
-        
-        result = await log_time_with_account(
-            mock_context,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description=unicode_description
-        )
-        
-        # Parse the JSON result
-        data = json.loads(result)
-        
-        assert data["success"] is True
-        assert data["description"] == unicode_description
-        
-        # Verify the method was called correctly
-        mock_context.dependencies.jira.log_time_to_account.assert_called_once_with(
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description=unicode_description,
-            project_key=None,
-            started=None
-        )
+    @pytest.mark.parametrize(
+        "tool, mock_attr, tool_kwargs",
+        [
+            pytest.param(list_accounts, "get_all_accounts", {}, id="list_accounts"),
+            pytest.param(
+                get_account_projects,
+                "get_account_projects",
+                {"account_id": "team-alpha"},
+                id="get_account_projects",
+            ),
+            pytest.param(
+                log_time,
+                "log_time_to_account",
+                {"account_id": "team-alpha", "issue_key": "PROJ-123", "time_spent": "2h"},
+                id="log_time",
+            ),
+        ],
+    )
+    async def test_account_tools_api_error(
+        self, mock_context, mock_jira, tool, mock_attr, tool_kwargs
+    ):
+        """Test that account tools report backend API errors."""
+        getattr(mock_jira, mock_attr).side_effect = HTTPError("API Error")
+        
+        result = await tool(mock_context, **tool_kwargs)
+        
+        _err(result, "Network or API Error: API Error")
 
 
 class TestAccountMCPToolsEnvironment:
     """Test suite for account MCP tools with environment configurations."""
     
-    @pytest.mark.asyncio
-    async def test_list_accounts_with_env_config(self):
-        """Test listing accounts with environment configuration."""
-        with patch.dict(os.environ, {
-            'ACCOUNT_MAPPINGS': 'team-alpha:PROJ,DEV;team-beta:SUPPORT,DOCS'
-        }):
-            # Mock context
-            ctx = Mock(spec=Context)
-            ctx.dependencies = Mock()
-            ctx.dependencies.jira = Mock()
-            
-            # Mock accounts based on environment
-            accounts = [
-                Account(id="team-alpha", name="Team Alpha"),
-                Account(id="team-beta", name="Team Beta")
-            ]
-            ctx.dependencies.jira.get_accounts.return_value = accounts
-            
-            result = await list_accounts(ctx)
-            
-            # Parse the JSON result
-            data = json.loads(result)
-            
-            assert data["success"] is True
-            assert len(data["accounts"]) == 2
-            assert data["accounts"][0]["id"] == "team-alpha"
-            assert data["accounts"][1]["id"] == "team-beta"
-
-    @pytest.mark.asyncio
-    async def test_get_account_projects_with_env_config(self):
-        """Test getting account projects with environment configuration."""
-        with patch.dict(os.environ, {
-            'ACCOUNT_MAPPINGS': 'team-alpha:PROJ,DEV;team-beta:SUPPORT,DOCS'
-        }):
-            # Mock context
-            ctx = Mock(spec=Context)
-            ctx.dependencies = Mock()
-            ctx.dependencies.jira = Mock()
-            
-            # Mock projects based on environment
-            projects = [
-                JiraProject(id="10001", key="PROJ", name="Project 1"),
-                JiraProject(id="10002", key="DEV", name="Development Project")
-            ]
-            ctx.dependencies.jira.get_account_projects.return_value = projects
-            
-            result = await get_account_projects(ctx, account_id="team-alpha")
-            
-            # Parse the JSON result
-            data = json.loads(result)
-            
-            assert data["success"] is True
-            assert data["account_id"] == "team-alpha"
-            assert len(data["projects"]) == 2
-            assert data["projects"][0]["key"] == "PROJ"
-            assert data["projects"][1]["key"] == "DEV"
-
-    @pytest.mark.asyncio
-    async def test_account_tools_error_handling(self):
-        """Test error handling in account tools."""
-        # Mock context with no jira dependency
-        ctx = Mock(spec=Context)
-        ctx.dependencies = Mock()
-        ctx.dependencies.jira = None
-        
-        # Test list_accounts with missing dependency
-        result = await list_accounts(ctx)
-        data = json.loads(result)
-        assert data["success"] is False
-        assert "error" in data
-        
-        # Test get_account_projects with missing dependency
-        result = await get_account_projects(ctx, account_id="team-alpha")
-        data = json.loads(result)
-        assert data["success"] is False
-        assert "error" in data
-        
-        # Test log_time_with_account with missing dependency
-        result = await log_time_with_account(
-            ctx,
-            account_id="team-alpha",
-            issue_key="PROJ-123",
-            time_spent="2h"
-        )
-        data = json.loads(result)
-        assert data["success"] is False
-        assert "error" in data 
\ No newline at end of file
+    @pytest.fixture
+    def missing_jira_fetcher(self):
+        """Make get_jira_fetcher fail as it does when Jira is not configured."""
+        with patch(
+            "mcp_atlassian.servers.jira.get_jira_fetcher",
+            AsyncMock(side_effect=ValueError("Jira client (fetcher) not available.")),
+        ):
+            yield
+
+    @pytest.mark.parametrize(
+        "tool, tool_kwargs",
+        [
+            pytest.param(list_accounts, {}, id="list_accounts"),
+            pytest.param(
+                get_account_projects,
+                {"account_id": "team-alpha"},
+                id="get_account_projects",
+            ),
+            pytest.param(
+                log_time,
+                {"account_id": "team-alpha", "issue_key": "PROJ-123", "time_spent": "2h"},
+                id="log_time",
+            ),
+        ],
+    )
+    async def test_account_tools_missing_jira_dependency(
+        self, mock_context, missing_jira_fetcher, tool, tool_kwargs
+    ):
+        """Test that account tools report a missing jira dependency."""
+        result = await tool(mock_context, **tool_kwargs)
+        
+        _err(result, "Configuration Error: Jira client (fetcher) not available.")
@@ -13,6 +13,7 @@ import pytest
 
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.models.jira.project import JiraProject
 from tests.utils.factories import AuthConfigFactory, JiraIssueFactory
 from tests.utils.mocks import MockAtlassianClient
 
@@ -181,6 +182,47 @@ def session_jira_issue_types():
     ]
 
 
+@pytest.fixture(scope="session")
+def session_jira_account_projects():
+    """
+    Session-scoped fixture providing projects for the account tests.
+
+    PROJ and DEV belong to the team-alpha account mapping; OTHER belongs to
+    no account. The models are built with model_construct since they are
+    test doubles only.
+
+    Returns:
+        Tuple[JiraProject, ...]: Mock Jira projects
+    """
+    return (
+        JiraProject.model_construct(id="10001", key="PROJ", name="Project 1"),
+        JiraProject.model_construct(id="10002", key="DEV", name="Development Project"),
+        JiraProject.model_construct(id="10003", key="OTHER", name="Unrelated Project"),
+    )
+
+
+@pytest.fixture(scope="session")
+def session_jira_account_worklog():
+    """
+    Session-scoped fixture providing an add_worklog result for the account tests.
+
+    The dictionary is shared across the session; copy it before changing fields.
+
+    Returns:
+        Dict[str, Any]: Mock worklog data
+    """
+    return {
+        "id": "12345",
+        "comment": "Test work",
+        "created": "2024-01-01T10:00:00.000Z",
+        "updated": "2024-01-01T10:00:00.000Z",
+        "started": "2024-01-01T09:00:00.000Z",
+        "timeSpent": "2h",
+        "timeSpentSeconds": 7200,
+        "author": "Test User",
+    }
+
+
 # ============================================================================
 # Configuration Fixtures
 # ============================================================================
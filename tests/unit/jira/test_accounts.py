@@ -5,385 +5,630 @@ This module tests the AccountsMixin functionality including account management,
 project mapping, and time logging operations.
 """
 
+import copy
 import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-from mcp_atlassian.jira.accounts import AccountsMixin
+from mcp_atlassian.jira import JiraConfig
+from mcp_atlassian.jira.accounts import (
+    _PROJECTS_CACHE,
+    AccountsMixin,
+    _parse_account_mappings,
+)
 from mcp_atlassian.models.jira.account import Account, TimeLogEntry
-from mcp_atlassian.models.jira.project import JiraProject
-from mcp_atlassian.models.jira.worklog import JiraWorklog
+from mcp_atlassian.models.jira.common import JiraUser
+
+
+ACCOUNT_MAPPINGS = "team-alpha:PROJ,DEV;team-beta:SUPPORT,DOCS;client-work:CLIENT1,CLIENT2"
+
+# Worklog start timestamp shared by the time log entry tests
+_T_STARTED = "2024-01-01T09:00:00.000Z"
+
+
+@pytest.fixture(autouse=True)
+def clear_projects_cache():
+    """Reset the process-wide project list cache between tests."""
+    _PROJECTS_CACHE.clear()
+    yield
+    _PROJECTS_CACHE.clear()
+
+
+@pytest.fixture(scope="module")
+def shared_accounts_mixin():
+    """Create one AccountsMixin with ACCOUNT_MAPPINGS loaded for the module."""
+    config = JiraConfig(
+        url="https://test.atlassian.net",
+        auth_type="basic",
+        username="test_username",
+        api_token="test_token",
+    )
+    with patch.dict(os.environ, {"ACCOUNT_MAPPINGS": ACCOUNT_MAPPINGS}):
+        mixin = AccountsMixin(config=config)
+        # AccountsMixin never calls the Jira client directly
+        mixin.jira = SimpleNamespace()
+        mixin._ensure_accounts_loaded()
+        yield mixin
 
 
 class TestAccountsMixin:
     """Test suite for AccountsMixin functionality."""
-    
+
     @pytest.fixture
-    def accounts_mixin(self):
-        """Create a mock AccountsMixin instance for testing."""
-        with patch.dict(os.environ, {
-            'ACCOUNT_MAPPINGS': 'team-alpha:PROJ,DEV;team-beta:SUPPORT,DOCS;client-work:CLIENT1,CLIENT2'
-        }):
-            mixin = AccountsMixin()
-            mixin._atlassian_client = Mock()
-            mixin._config = Mock()
-            mixin._config.user_agent = "TestAgent"
-            return mixin
+    def accounts_mixin(self, shared_accounts_mixin):
+        """Give each test its own shallow copy of the preloaded AccountsMixin."""
+        mixin = copy.copy(shared_accounts_mixin)
+        mixin._accounts = copy.copy(mixin._accounts)
+        mixin._account_project_mappings = copy.copy(mixin._account_project_mappings)
+        return mixin
 
     def test_load_account_mappings(self, accounts_mixin):
         """Test loading account mappings from environment variables."""
         accounts_mixin._load_account_mappings()
-        
+
         assert len(accounts_mixin._accounts) == 3
         assert 'team-alpha' in accounts_mixin._accounts
         assert 'team-beta' in accounts_mixin._accounts
         assert 'client-work' in accounts_mixin._accounts
-        
+
         # Check account details
         team_alpha = accounts_mixin._accounts['team-alpha']
         assert team_alpha.id == 'team-alpha'
-        assert team_alpha.name == 'Team Alpha'
-        
+        assert team_alpha.name == 'team-alpha'
+
         # Check project mappings
-        assert accounts_mixin._account_project_mappings['team-alpha'] == ['PROJ', 'DEV']
-        assert accounts_mixin._account_project_mappings['team-beta'] == ['SUPPORT', 'DOCS']
-        assert accounts_mixin._account_project_mappings['client-work'] == ['CLIENT1', 'CLIENT2']
+        assert accounts_mixin._account_project_mappings == {
+            'team-alpha': ['PROJ', 'DEV'],
+            'team-beta': ['SUPPORT', 'DOCS'],
+            'client-work': ['CLIENT1', 'CLIENT2'],
+        }
 
-    def test_load_account_mappings_no_env_var(self):
+    def test_load_account_mappings_no_env_var(self, accounts_mixin, monkeypatch):
         """Test loading account mappings when no environment variable is set."""
-        with patch.dict(os.environ, {}, clear=True):
-            mixin = AccountsMixin()
-            mixin._load_account_mappings()
-            
-            assert len(mixin._accounts) == 0
-            assert len(mixin._account_project_mappings) == 0
-
-    def test_load_account_mappings_invalid_format(self):
-        """Test loading account mappings with invalid format."""
-        with patch.dict(os.environ, {'ACCOUNT_MAPPINGS': 'invalid-format'}):
-            mixin = AccountsMixin()
-            mixin._load_account_mappings()
-            
-            # Should handle invalid format gracefully
-            assert len(mixin._accounts) == 0
-
-    def test_format_account_name(self, accounts_mixin):
-        """Test account name formatting."""
-        assert accounts_mixin._format_account_name('team-alpha') == 'Team Alpha'
-        assert accounts_mixin._format_account_name('client-work') == 'Client Work'
-        assert accounts_mixin._format_account_name('simple') == 'Simple'
-        assert accounts_mixin._format_account_name('multi-word-name') == 'Multi Word Name'
+        monkeypatch.delenv("ACCOUNT_MAPPINGS", raising=False)
+        accounts_mixin.reload_account_mappings()
+
+        # Falls back to an empty default account
+        assert list(accounts_mixin._accounts) == ['default']
+        assert accounts_mixin._account_project_mappings == {'default': []}
+
+    def test_parse_account_mappings_invalid_format(self):
+        """Test parsing account mappings with invalid format."""
+        # Should handle invalid format gracefully
+        assert _parse_account_mappings('invalid-format') == ()
+        assert _parse_account_mappings('') == ()
+
+    def test_parse_account_mappings_skips_empty_entries(self):
+        """Test that malformed entries and blank project keys are dropped."""
+        assert _parse_account_mappings(' ops : OPS, ,INFRA ;bad;;web:WEB,') == (
+            ('ops', ('OPS', 'INFRA')),
+            ('web', ('WEB',)),
+        )
+
+    def test_parse_account_mappings_is_cached(self, accounts_mixin):
+        """Test that the parse is shared per ACCOUNT_MAPPINGS value."""
+        parsed = _parse_account_mappings(ACCOUNT_MAPPINGS)
+        assert parsed == (
+            ('team-alpha', ('PROJ', 'DEV')),
+            ('team-beta', ('SUPPORT', 'DOCS')),
+            ('client-work', ('CLIENT1', 'CLIENT2')),
+        )
+        assert _parse_account_mappings(ACCOUNT_MAPPINGS) is parsed
+
+        # A changed value is picked up without clearing the cache
+        with patch.dict(os.environ, {'ACCOUNT_MAPPINGS': 'solo:SOLO'}):
+            accounts_mixin.reload_account_mappings()
+
+            assert list(accounts_mixin._accounts) == ['solo']
+            assert accounts_mixin._account_project_mappings == {'solo': ['SOLO']}
 
     def test_get_accounts_all(self, accounts_mixin):
         """Test getting all accounts."""
-        accounts_mixin._load_account_mappings()
-        accounts = accounts_mixin.get_accounts()
-        
+        accounts = accounts_mixin.get_all_accounts()
+
         assert len(accounts) == 3
-        account_ids = [acc.id for acc in accounts]
+        account_ids = [acc['id'] for acc in accounts]
         assert 'team-alpha' in account_ids
         assert 'team-beta' in account_ids
         assert 'client-work' in account_ids
 
+    def test_get_accounts_shares_serialized_creator(self, accounts_mixin):
+        """Test that accounts with the same creator serialize that user once."""
+        creator = JiraUser(account_id="user123", display_name="Test User")
+        for account_id in ('team-alpha', 'team-beta'):
+            accounts_mixin._accounts[account_id] = accounts_mixin._accounts[
+                account_id
+            ].model_copy(update={"created_by": creator})
+
+        alpha, beta = accounts_mixin.get_all_accounts(search_filter='team')
+
+        assert alpha['created_by'] == creator.to_simplified_dict()
+        assert alpha['created_by'] is beta['created_by']
+
     def test_get_accounts_with_filter(self, accounts_mixin):
         """Test getting accounts with search filter."""
-        accounts_mixin._load_account_mappings()
-        
         # Test case-insensitive search
-        accounts = accounts_mixin.get_accounts(search_filter='team')
+        accounts = accounts_mixin.get_all_accounts(search_filter='TEAM')
         assert len(accounts) == 2
-        account_ids = [acc.id for acc in accounts]
+        account_ids = [acc['id'] for acc in accounts]
         assert 'team-alpha' in account_ids
         assert 'team-beta' in account_ids
 
         # Test partial match
-        accounts = accounts_mixin.get_accounts(search_filter='alpha')
+        accounts = accounts_mixin.get_all_accounts(search_filter='alpha')
         assert len(accounts) == 1
-        assert accounts[0].id == 'team-alpha'
+        assert accounts[0]['id'] == 'team-alpha'
 
         # Test no match
-        accounts = accounts_mixin.get_accounts(search_filter='nonexistent')
+        accounts = accounts_mixin.get_all_accounts(search_filter='nonexistent')
         assert len(accounts) == 0
 
-    def test_get_account_projects(self, accounts_mixin):
+    def test_account_names_lowercased_at_load(self, accounts_mixin):
+        """Test that search filters match names lowercased once per load."""
+        with patch.dict(os.environ, {'ACCOUNT_MAPPINGS': 'Team-Alpha:PROJ;Ops:OPS'}):
+            accounts_mixin.reload_account_mappings()
+
+        assert accounts_mixin._account_names_lower == {
+            'Team-Alpha': 'team-alpha',
+            'Ops': 'ops',
+        }
+        accounts = accounts_mixin.get_all_accounts(search_filter='ALPHA')
+        assert [acc['id'] for acc in accounts] == ['Team-Alpha']
+
+    def test_get_accounts_paginated(self, accounts_mixin):
+        """Test limiting and offsetting the returned accounts."""
+        page = accounts_mixin.get_all_accounts(limit=2)
+        assert [acc['id'] for acc in page] == ['team-alpha', 'team-beta']
+
+        page = accounts_mixin.get_all_accounts(limit=2, offset=2)
+        assert [acc['id'] for acc in page] == ['client-work']
+
+        page = accounts_mixin.get_all_accounts(search_filter='team', offset=1)
+        assert [acc['id'] for acc in page] == ['team-beta']
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"offset": -1}, {"limit": -1}], ids=["offset", "limit"]
+    )
+    def test_get_accounts_negative_pagination(self, accounts_mixin, kwargs):
+        """Test that negative limits and offsets are rejected, not swallowed."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            accounts_mixin.get_all_accounts(**kwargs)
+
+    def test_count_accounts(self, accounts_mixin):
+        """Test counting every account that matches a search filter."""
+        assert accounts_mixin.count_accounts() == 3
+        assert accounts_mixin.count_accounts(search_filter='TEAM') == 2
+        assert accounts_mixin.count_accounts(search_filter='nonexistent') == 0
+
+    def test_get_account_projects(self, accounts_mixin, session_jira_account_projects):
         """Test getting projects for a specific account."""
-        accounts_mixin._load_account_mappings()
-        
-        # Mock the get_projects method
-        mock_projects = [
-            JiraProject(id="10001", key="PROJ", name="Project 1"),
-            JiraProject(id="10002", key="DEV", name="Development Project")
+        # Stub the get_all_projects method provided by ProjectsMixin
+        all_projects = [
+            project.to_simplified_dict() for project in session_jira_account_projects
         ]
-        accounts_mixin.get_projects = Mock(return_value=mock_projects)
-        
+        accounts_mixin.get_all_projects = lambda *args, **kwargs: all_projects
+
         projects = accounts_mixin.get_account_projects('team-alpha')
-        
+
         assert len(projects) == 2
-        assert projects[0].key == 'PROJ'
-        assert projects[1].key == 'DEV'
+        assert projects[0]['key'] == 'PROJ'
+        assert projects[1]['key'] == 'DEV'
+
+    def test_get_account_projects_caches_project_list(self, accounts_mixin):
+        """Test that repeated lookups reuse the project list until invalidated."""
+        accounts_mixin.get_all_projects = Mock(
+            return_value=[{"key": "PROJ", "name": "Project 1"}]
+        )
+
+        accounts_mixin.get_account_projects('team-alpha')
+        accounts_mixin.get_account_projects('team-beta')
+        assert accounts_mixin.get_all_projects.call_count == 1
+
+        # An expired entry is fetched again
+        accounts_mixin._get_all_projects_cached(accounts_mixin.get_all_projects, ttl=0)
+        assert accounts_mixin.get_all_projects.call_count == 2
+
+        accounts_mixin.invalidate_projects_cache()
+        accounts_mixin.get_account_projects('team-alpha')
+        assert accounts_mixin.get_all_projects.call_count == 3
+
+    def test_get_account_projects_shares_cache_across_fetchers(self, accounts_mixin):
+        """Test that fetchers for the same site and credentials share projects."""
+        get_all_projects = Mock(return_value=[{"key": "PROJ", "name": "Project 1"}])
+        accounts_mixin.get_all_projects = get_all_projects
+        accounts_mixin.get_account_projects('team-alpha')
+
+        # A new fetcher per tool call reuses the list fetched by the last one
+        same_user = copy.copy(accounts_mixin)
+        same_user._projects_by_key = {}
+        assert same_user.get_account_projects('team-alpha') == [
+            {"key": "PROJ", "name": "Project 1"}
+        ]
+        assert get_all_projects.call_count == 1
+
+        # Other credentials never see that list
+        other_user = copy.copy(accounts_mixin)
+        other_user.config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="basic",
+            username="other_username",
+            api_token="other_token",
+        )
+        other_user.get_account_projects('team-alpha')
+        assert get_all_projects.call_count == 2
 
     def test_get_account_projects_invalid_account(self, accounts_mixin):
         """Test getting projects for an invalid account."""
-        accounts_mixin._load_account_mappings()
-        
-        with pytest.raises(ValueError, match="Account 'invalid-account' not found"):
-            accounts_mixin.get_account_projects('invalid-account')
+        assert accounts_mixin.get_account_projects('invalid-account') == []
 
     def test_get_account_projects_no_projects(self, accounts_mixin):
         """Test getting projects when account has no projects."""
-        accounts_mixin._load_account_mappings()
-        accounts_mixin.get_projects = Mock(return_value=[])
-        
+        accounts_mixin.get_all_projects = lambda *args, **kwargs: []
+
         projects = accounts_mixin.get_account_projects('team-alpha')
         assert len(projects) == 0
 
-    def test_log_time_to_account(self, accounts_mixin):
-        """Test logging time to an account."""
-        accounts_mixin._load_account_mappings()
-        
-        # Mock the get_projects method to return projects for the account
-        mock_projects = [
-            JiraProject(id="10001", key="PROJ", name="Project 1"),
-            JiraProject(id="10002", key="DEV", name="Development Project")
-        ]
-        accounts_mixin.get_projects = Mock(return_value=mock_projects)
-        
-        # Mock the add_worklog method
-        mock_worklog = JiraWorklog(
-            id="12345",
-            author_account_id="user123",
-            author_display_name="Test User",
-            created="2024-01-01T10:00:00.000Z",
-            updated="2024-01-01T10:00:00.000Z",
-            started="2024-01-01T09:00:00.000Z",
-            time_spent="2h",
-            time_spent_seconds=7200,
-            comment="Test work"
-        )
-        accounts_mixin.add_worklog = Mock(return_value=mock_worklog)
-        
-        # Test logging time to account
+    @pytest.mark.parametrize(
+        "log_kwargs, expected_entry, expected_calls, expected_error",
+        [
+            pytest.param(
+                {
+                    "project_key": "PROJ",
+                    "issue_key": "PROJ-123",
+                    "description": "Test work",
+                },
+                {"id": "12345", "description": "Test work"},
+                [
+                    {
+                        "issue_key": "PROJ-123",
+                        "time_spent": "2h",
+                        "comment": "Test work",
+                        "started": None,
+                    }
+                ],
+                None,
+                id="with_issue",
+            ),
+            pytest.param(
+                {"project_key": "INVALID", "issue_key": "INVALID-123"},
+                None,
+                [],
+                "Invalid account access for account team-alpha",
+                id="invalid_project",
+            ),
+            pytest.param(
+                {"description": "General work"},
+                {"description": "General work"},
+                [],
+                None,
+                id="without_issue",
+            ),
+        ],
+    )
+    def test_log_time_to_account(
+        self,
+        accounts_mixin,
+        session_jira_account_worklog,
+        log_kwargs,
+        expected_entry,
+        expected_calls,
+        expected_error,
+    ):
+        """Test logging time to an account with and without an issue."""
+        # Stub the add_worklog method provided by WorklogMixin, recording each call
+        add_worklog_calls = []
+
+        def add_worklog(**kwargs):
+            add_worklog_calls.append(kwargs)
+            return session_jira_account_worklog
+
+        accounts_mixin.add_worklog = add_worklog
+
         result = accounts_mixin.log_time_to_account(
-            account_id="team-alpha",
-            project_key="PROJ",
-            issue_key="PROJ-123",
-            time_spent="2h",
-            description="Test work"
-        )
-        
-        assert result is not None
-        assert result.time_spent == "2h"
-        assert result.comment == "Test work"
-        
-        # Verify that add_worklog was called with correct parameters
-        accounts_mixin.add_worklog.assert_called_once_with(
-            issue_key="PROJ-123",
-            time_spent="2h",
-            comment="Test work",
-            started=None
+            account_id="team-alpha", time_spent="2h", **log_kwargs
         )
 
+        assert add_worklog_calls == expected_calls
+        if expected_error:
+            assert result["success"] is False
+            assert result["error"] == expected_error
+            return
+
+        assert result["success"] is True
+        assert result["account_name"] == "team-alpha"
+        entry = result["time_log_entry"]
+        assert entry["time_spent"] == "2h"
+        assert entry["time_spent_seconds"] == 7200
+        assert entry.get("project_id") == log_kwargs.get("project_key")
+        assert {key: entry[key] for key in expected_entry} == expected_entry
+        if "issue_key" not in log_kwargs:
+            # Account-level entries get a generated ID and a single timestamp
+            assert entry["id"].startswith("account_team-alpha_")
+            assert entry["started"] == entry["created"] == entry["updated"]
+
     def test_log_time_to_account_invalid_account(self, accounts_mixin):
         """Test logging time to an invalid account."""
-        accounts_mixin._load_account_mappings()
-        
-        with pytest.raises(ValueError, match="Account 'invalid-account' not found"):
-            accounts_mixin.log_time_to_account(
-                account_id="invalid-account",
-                project_key="PROJ",
-                issue_key="PROJ-123",
-                time_spent="2h"
-            )
-
-    def test_log_time_to_account_invalid_project(self, accounts_mixin):
-        """Test logging time to a project not in the account."""
-        accounts_mixin._load_account_mappings()
-        
-        # Mock the get_projects method to return projects for the account
-        mock_projects = [
-            JiraProject(id="10001", key="PROJ", name="Project 1"),
-            JiraProject(id="10002", key="DEV", name="Development Project")
-        ]
-        accounts_mixin.get_projects = Mock(return_value=mock_projects)
-        
-        with pytest.raises(ValueError, match="Project 'INVALID' is not associated with account 'team-alpha'"):
-            accounts_mixin.log_time_to_account(
-                account_id="team-alpha",
-                project_key="INVALID",
-                issue_key="INVALID-123",
-                time_spent="2h"
-            )
-
-    def test_log_time_to_account_without_project(self, accounts_mixin):
-        """Test logging time to account without specifying project."""
-        accounts_mixin._load_account_mappings()
-        
-        # Mock the get_projects method to return projects for the account
-        mock_projects = [
-            JiraProject(id="10001", key="PROJ", name="Project 1"),
-            JiraProject(id="10002", key="DEV", name="Development Project")
-        ]
-        accounts_mixin.get_projects = Mock(return_value=mock_projects)
-        
-        # Mock the add_worklog method
-        mock_worklog = JiraWorklog(
-            id="12345",
-            author_account_id="user123",
-            author_display_name="Test User",
-            created="2024-01-01T10:00:00.000Z",
-            updated="2024-01-01T10:00:00.000Z",
-            started="2024-01-01T09:00:00.000Z",
-            time_spent="2h",
-            time_spent_seconds=7200,
-            comment="General work for Team Alpha"
-        )
-        accounts_mixin.add_worklog = Mock(return_value=mock_worklog)
-        
-        # Test logging time to account (should use first project)
         result = accounts_mixin.log_time_to_account(
-            account_id="team-alpha",
+            account_id="invalid-account",
+            project_key="PROJ",
             issue_key="PROJ-123",
-            time_spent="2h",
-            description="General work"
+            time_spent="2h"
         )
-        
-        assert result is not None
-        assert result.time_spent == "2h"
+
+        assert result["success"] is False
+        assert result["error"] == "Invalid account access for account invalid-account"
+
+    def test_project_to_accounts_index(self, accounts_mixin):
+        """Test the reverse project to accounts index."""
+        with patch.dict(
+            os.environ, {'ACCOUNT_MAPPINGS': 'team-alpha:PROJ,DEV;platform:DEV'}
+        ):
+            accounts_mixin.reload_account_mappings()
+
+        assert accounts_mixin._project_to_accounts == {
+            'PROJ': {'team-alpha'},
+            'DEV': {'team-alpha', 'platform'},
+        }
+        assert accounts_mixin.validate_account_access('platform', 'DEV') is True
+        assert accounts_mixin.validate_account_access('platform', 'PROJ') is False
+
+    @pytest.mark.parametrize(
+        "time_spent, expected_seconds",
+        [
+            ("2h", 7200),
+            ("1.5h", 5400),
+            ("30m", 1800),
+            ("1d", 86400),
+            (" 45 ", 2700),
+            ("invalid", 60),
+            ("2w", 60),
+        ],
+    )
+    def test_simple_parse_time_spent(self, accounts_mixin, time_spent, expected_seconds):
+        """Test the fallback time parser used without WorklogMixin."""
+        assert accounts_mixin._simple_parse_time_spent(time_spent) == expected_seconds
 
     def test_validate_account_access(self, accounts_mixin):
         """Test account access validation."""
-        accounts_mixin._load_account_mappings()
-        
         # Valid account should pass
         assert accounts_mixin.validate_account_access('team-alpha') is True
-        
+        assert accounts_mixin.validate_account_access('team-alpha', 'DEV') is True
+
+        # Project outside the account should fail
+        assert accounts_mixin.validate_account_access('team-alpha', 'DOCS') is False
+
         # Invalid account should fail
         assert accounts_mixin.validate_account_access('invalid-account') is False
 
-    def test_get_account_summary(self, accounts_mixin):
-        """Test getting account summary information."""
-        accounts_mixin._load_account_mappings()
-        
-        # Mock the get_projects method
-        mock_projects = [
-            JiraProject(id="10001", key="PROJ", name="Project 1"),
-            JiraProject(id="10002", key="DEV", name="Development Project")
-        ]
-        accounts_mixin.get_projects = Mock(return_value=mock_projects)
-        
-        summary = accounts_mixin.get_account_summary('team-alpha')
-        
-        assert summary['account_id'] == 'team-alpha'
-        assert summary['account_name'] == 'Team Alpha'
-        assert summary['project_count'] == 2
-        assert len(summary['projects']) == 2
-        assert summary['projects'][0]['key'] == 'PROJ'
-        assert summary['projects'][1]['key'] == 'DEV'
-
-    def test_get_account_summary_invalid_account(self, accounts_mixin):
-        """Test getting summary for invalid account."""
-        accounts_mixin._load_account_mappings()
-        
-        with pytest.raises(ValueError, match="Account 'invalid-account' not found"):
-            accounts_mixin.get_account_summary('invalid-account')
-
 
 class TestAccountModels:
     """Test suite for Account and TimeLogEntry models."""
-    
-    def test_account_model_creation(self):
-        """Test creating an Account model."""
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param(
+                {
+                    "id": "team-alpha",
+                    "name": "Team Alpha",
+                    "description": "Alpha team projects",
+                    "is_active": True,
+                },
+                {
+                    "id": "team-alpha",
+                    "name": "Team Alpha",
+                    "description": "Alpha team projects",
+                    "is_active": True,
+                },
+                id="creation",
+            ),
+            pytest.param(
+                {},
+                {
+                    "id": "0",
+                    "name": "",
+                    "description": None,
+                    "project_keys": [],
+                    "is_active": True,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                # Extra fields are accepted and ignored
+                {"id": "test-account", "name": "Test Account", "extra_field": "extra_value"},
+                {"id": "test-account", "name": "Test Account"},
+                id="extra_field",
+            ),
+        ],
+    )
+    def test_account_model(self, kwargs, expected):
+        """Test Account construction from keyword arguments."""
+        account = Account(**kwargs)
+
+        assert account.model_dump(include=set(expected)) == expected
+
+    def test_account_to_simplified_dict(self):
+        """Test Account serialization omits empty optional fields."""
         account = Account(
             id="team-alpha",
-            name="Team Alpha",
-            description="Alpha team projects",
-            is_active=True
+            name="team-alpha",
+            project_keys=["PROJ", "DEV"],
+            created_by=JiraUser(account_id="user123", display_name="Test User"),
         )
-        
-        assert account.id == "team-alpha"
+
+        assert account.to_simplified_dict() == {
+            "id": "team-alpha",
+            "name": "team-alpha",
+            "is_active": True,
+            "project_count": 2,
+            "project_keys": ["PROJ", "DEV"],
+            "created_by": account.created_by.to_simplified_dict(),
+        }
+        assert Account(id="empty").to_simplified_dict() == {
+            "id": "empty",
+            "name": "",
+            "is_active": True,
+            "project_count": 0,
+        }
+
+    def test_account_from_api_response(self):
+        """Test that the fast and validated API paths build the same Account."""
+        data = {
+            "id": 42,
+            "name": "Team Alpha",
+            "project_keys": ["PROJ", "DEV"],
+            "created_by": {"accountId": "user123", "displayName": "Test User"},
+        }
+
+        account = Account.from_api_response(data)
+        validated = Account.from_api_response_validated(data)
+
+        assert account == validated
+        assert account.id == "42"
+        assert account.project_keys == ["PROJ", "DEV"]
         assert account.name == "Team Alpha"
-        assert account.description == "Alpha team projects"
-        assert account.is_active is True
-
-    def test_account_model_defaults(self):
-        """Test Account model with default values."""
-        account = Account()
-        
-        assert account.id == ""
-        assert account.name == ""
-        assert account.description == ""
-        assert account.is_active is True
-
-    def test_time_log_entry_model_creation(self):
-        """Test creating a TimeLogEntry model."""
+        assert account.created_by.display_name == "Test User"
+        assert Account.from_api_response({}) == Account()
+
+        # A string is not split into single-character project keys
+        assert Account.from_api_response({"project_keys": "ABC"}).project_keys == []
+
+    def test_time_log_entry_from_api_response(self):
+        """Test that the fast and validated API paths build the same entry."""
+        data = {
+            "id": "log-123",
+            "account_id": "team-alpha",
+            "time_spent": "2h",
+            "time_spent_seconds": "7200",
+        }
+
+        entry = TimeLogEntry.from_api_response(data)
+
+        assert entry == TimeLogEntry.from_api_response_validated(data)
+        assert entry.time_spent_seconds == 7200
+        assert entry.started == ""
+        assert TimeLogEntry.from_api_response(None) == TimeLogEntry()
+
+    def test_from_api_response_coerces_non_str_values(self):
+        """Test that both API paths coerce non-string values the same way."""
+        account_data = {"id": "acc", "description": 123, "project_keys": [1, None, "PROJ"]}
+        account = Account.from_api_response(account_data)
+
+        assert account == Account.from_api_response_validated(account_data)
+        assert account.description == "123"
+        assert account.project_keys == ["PROJ"]
+
+        entry_data = {"project_id": 10001, "issue_key": 7, "description": 1.5}
+        entry = TimeLogEntry.from_api_response(entry_data)
+
+        assert entry == TimeLogEntry.from_api_response_validated(entry_data)
+        assert entry.project_id == "10001"
+        assert entry.issue_key == "7"
+        assert entry.description == "1.5"
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param(
+                {
+                    "id": "log-123",
+                    "account_id": "team-alpha",
+                    "project_id": "PROJ",
+                    "issue_key": "PROJ-123",
+                    "time_spent": "2h",
+                    "time_spent_seconds": 7200,
+                    "description": "Development work",
+                    "started": _T_STARTED,
+                    "user": JiraUser(account_id="user123", display_name="Test User"),
+                },
+                {
+                    "id": "log-123",
+                    "account_id": "team-alpha",
+                    "project_id": "PROJ",
+                    "issue_key": "PROJ-123",
+                    "time_spent": "2h",
+                    "time_spent_seconds": 7200,
+                    "description": "Development work",
+                    "started": _T_STARTED,
+                    "user": JiraUser(account_id="user123", display_name="Test User"),
+                },
+                id="creation",
+            ),
+            pytest.param(
+                {"account_id": "team-alpha"},
+                {
+                    "id": "0",
+                    "account_id": "team-alpha",
+                    "project_id": None,
+                    "issue_key": None,
+                    "time_spent": "",
+                    "time_spent_seconds": 0,
+                    "description": None,
+                    "started": "",
+                    "user": None,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {"account_id": "team-alpha", "time_spent": "2h", "time_spent_seconds": 7200},
+                {"account_id": "team-alpha", "time_spent": "2h", "time_spent_seconds": 7200},
+                id="time_fields",
+            ),
+        ],
+    )
+    def test_time_log_entry_model(self, kwargs, expected):
+        """Test TimeLogEntry construction from keyword arguments."""
+        entry = TimeLogEntry(**kwargs)
+
+        # Compare attributes so nested models are checked by model equality
+        assert {key: getattr(entry, key) for key in expected} == expected
+
+    def test_time_log_entry_to_simplified_dict(self):
+        """Test TimeLogEntry serialization keeps required and non-empty fields."""
+        user = JiraUser(account_id="user123", display_name="Test User")
         entry = TimeLogEntry(
             id="log-123",
             account_id="team-alpha",
-            project_key="PROJ",
             issue_key="PROJ-123",
+            user=user,
             time_spent="2h",
             time_spent_seconds=7200,
-            description="Development work",
-            started="2024-01-01T09:00:00.000Z",
-            author_account_id="user123",
-            author_display_name="Test User"
+            started=_T_STARTED,
         )
-        
-        assert entry.id == "log-123"
-        assert entry.account_id == "team-alpha"
-        assert entry.project_key == "PROJ"
-        assert entry.issue_key == "PROJ-123"
-        assert entry.time_spent == "2h"
-        assert entry.time_spent_seconds == 7200
-        assert entry.description == "Development work"
-        assert entry.started == "2024-01-01T09:00:00.000Z"
-        assert entry.author_account_id == "user123"
-        assert entry.author_display_name == "Test User"
-
-    def test_time_log_entry_model_defaults(self):
-        """Test TimeLogEntry model with default values."""
-        entry = TimeLogEntry(account_id="team-alpha")
-        
-        assert entry.id == ""
-        assert entry.account_id == "team-alpha"
-        assert entry.project_key == ""
-        assert entry.issue_key == ""
-        assert entry.time_spent == ""
-        assert entry.time_spent_seconds == 0
-        assert entry.description == ""
-        assert entry.started == ""
-        assert entry.author_account_id == ""
-        assert entry.author_display_name == ""
-
-    def test_account_model_validation(self):
-        """Test Account model validation."""
-        # Test required fields
-        account = Account(id="test-account", name="Test Account")
-        assert account.id == "test-account"
-        assert account.name == "Test Account"
-        
-        # Test that model accepts extra fields gracefully
-        account_dict = {
-            "id": "test-account",
-            "name": "Test Account",
-            "extra_field": "extra_value"
+
+        assert entry.to_simplified_dict() == {
+            "id": "log-123",
+            "account_id": "team-alpha",
+            "time_spent": "2h",
+            "time_spent_seconds": 7200,
+            "issue_key": "PROJ-123",
+            "user": user.to_simplified_dict(),
+            "started": _T_STARTED,
         }
-        account = Account(**account_dict)
-        assert account.id == "test-account"
-        assert account.name == "Test Account"
-
-    def test_time_log_entry_model_validation(self):
-        """Test TimeLogEntry model validation."""
-        # Test required account_id
-        entry = TimeLogEntry(account_id="team-alpha")
-        assert entry.account_id == "team-alpha"
-        
-        # Test time validation
-        entry = TimeLogEntry(
-            account_id="team-alpha",
-            time_spent="2h",
-            time_spent_seconds=7200
+        assert TimeLogEntry(account_id="team-alpha").to_simplified_dict() == {
+            "id": "0",
+            "account_id": "team-alpha",
+            "time_spent": "",
+            "time_spent_seconds": 0,
+        }
+
+    def test_time_log_entry_to_simplified_dict_user_cache(self):
+        """Test that a shared user cache serializes each user object once."""
+        user = JiraUser(account_id="user123", display_name="Test User")
+        entries = [
+            TimeLogEntry(id=f"log-{i}", account_id="team-alpha", user=user)
+            for i in range(3)
+        ]
+        user_cache = {}
+
+        with patch.object(
+            JiraUser, "to_simplified_dict", autospec=True,
+            return_value={"display_name": "Test User"},
+        ) as to_simplified_dict:
+            results = [entry.to_simplified_dict(user_cache) for entry in entries]
+
+        to_simplified_dict.assert_called_once_with(user)
+        assert all(
+            result["user"] == {"display_name": "Test User"} for result in results
         )
-        assert entry.time_spent == "2h"
-        assert entry.time_spent_seconds == 7200 
\ No newline at end of file
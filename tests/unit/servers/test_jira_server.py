@@ -296,6 +296,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         get_user_profile,
         get_worklog,
         link_to_epic,
+        list_accounts,
         remove_issue_link,
         search,
         search_fields,
@@ -333,6 +334,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     jira_sub_mcp.tool()(transition_issue)
     jira_sub_mcp.tool()(update_sprint)
     jira_sub_mcp.tool()(batch_create_versions)
+    jira_sub_mcp.tool()(list_accounts)
     test_mcp.mount("jira", jira_sub_mcp)
     return test_mcp
 
@@ -1066,6 +1068,51 @@ async def test_get_all_projects_tool_configuration_error_handling(
     assert "Configuration Error" in data["error"]
 
 
+@pytest.mark.anyio
+async def test_list_accounts_tool(jira_client, mock_jira_fetcher):
+    """Test listing accounts without pagination reports the page length as total."""
+    accounts = [{"id": "team-alpha"}, {"id": "team-beta"}]
+    mock_jira_fetcher.get_all_accounts.return_value = accounts
+
+    response = await jira_client.call_tool(
+        "jira_list_accounts", {"search_filter": "team"}
+    )
+
+    data = json.loads(response[0].text)
+    assert data == {"success": True, "accounts": accounts, "total": 2, "start_at": 0}
+    mock_jira_fetcher.get_all_accounts.assert_called_once_with(
+        search_filter="team", limit=None, offset=0
+    )
+    mock_jira_fetcher.count_accounts.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_list_accounts_tool_paginated(jira_client, mock_jira_fetcher):
+    """Test that a paginated account listing reports every match as total."""
+    accounts = [{"id": "team-beta"}]
+    mock_jira_fetcher.get_all_accounts.return_value = accounts
+    mock_jira_fetcher.count_accounts.return_value = 3
+
+    response = await jira_client.call_tool(
+        "jira_list_accounts", {"limit": 1, "start_at": 1}
+    )
+
+    data = json.loads(response[0].text)
+    assert data == {"success": True, "accounts": accounts, "total": 3, "start_at": 1}
+    mock_jira_fetcher.get_all_accounts.assert_called_once_with(
+        search_filter=None, limit=1, offset=1
+    )
+    mock_jira_fetcher.count_accounts.assert_called_once_with(search_filter=None)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("arguments", [{"limit": 0}, {"start_at": -1}])
+async def test_list_accounts_tool_invalid_pagination(jira_client, arguments):
+    """Test that out-of-range pagination arguments are rejected."""
+    with pytest.raises(ToolError):
+        await jira_client.call_tool("jira_list_accounts", arguments)
+
+
 @pytest.mark.anyio
 async def test_batch_create_versions_all_success(jira_client, mock_jira_fetcher):
     """Test batch creation of Jira versions where all succeed."""